@@ -12,11 +12,13 @@ This demonstrates the main features of asmqdm, which provides a high-performance
 API backed by x86_64 Assembly for high-performance progress bar rendering.
 """
 
+import os
 import sys
 import time
 
 # Add src/python to path (for development)
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0] + "/src/python")
+_HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_HERE, "src", "python"))
 
 from asmqdm import asmqdm, trange
 
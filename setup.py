@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026-present Steven Baumann (@SBNovaScript)
+# Original repository: https://github.com/SBNovaScript/asmqdm
+# See LICENSE and NOTICE in the repository root for details.
+# Please retain this header, thank you!
+
+"""
+Build hooks for asmqdm.
+
+Package metadata lives in pyproject.toml. This file adds two compiled
+fast paths, both of which leave the pure-Python package fully
+functional when they are unavailable:
+
+- _asmqdm_iter, a small C extension fusing next()+update for list and
+  tuple iteration. Marked optional so the build succeeds (without the
+  fast path) on hosts with no C compiler.
+- an opt-in Cython build of asmqdm.core: when ASMQDM_CYTHONIZE=1 is
+  set and Cython is installed, core.py is compiled to a C extension,
+  turning its method dispatch and attribute access into C field loads.
+
+    ASMQDM_CYTHONIZE=1 pip install -e .
+"""
+
+import os
+
+from setuptools import Extension, setup
+
+# Aggressive codegen for the iterator hot loop. The package already
+# targets Linux x86_64 only (the core is hand-written Assembly), so
+# -march=native costs no portability we haven't already spent; -flto
+# and -fno-plt tighten the tp_iternext call sequence.
+_ITER_CFLAGS = ["-O3", "-march=native", "-flto", "-fno-plt"]
+
+ext_modules = [
+    Extension(
+        "asmqdm._asmqdm_iter",
+        sources=["src/c/_asmqdm_iter.c"],
+        extra_compile_args=_ITER_CFLAGS,
+        extra_link_args=["-flto"],
+        optional=True,
+    ),
+]
+
+if os.environ.get("ASMQDM_CYTHONIZE") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules += cythonize(
+        ["src/python/asmqdm/core.py"],
+        compiler_directives={"language_level": "3"},
+    )
+
+setup(ext_modules=ext_modules)
@@ -486,6 +486,65 @@ progress_bar_update:
     pop rbp
     ret
 
+; --------------------------------------------
+; progress_bar_run_range - Drive a whole range loop internally
+; --------------------------------------------
+; @brief    Runs a complete start/stop/step loop with one FFI entry
+; @param    rdi = ProgressBar* state pointer
+; @param    rsi = start value
+; @param    rdx = stop value (exclusive)
+; @param    rcx = step (positive or negative, zero iterates nothing)
+; @return   rax = current count after the loop
+; @clobbers all caller-save registers (rbx, r12-r14 saved)
+; @note     Calls progress_bar_update once per step, so rate limiting
+; @note     and rendering behave exactly like the per-call API
+; --------------------------------------------
+global progress_bar_run_range
+progress_bar_run_range:
+    push rbp
+    mov rbp, rsp
+    push rbx
+    push r12
+    push r13
+    push r14
+
+    mov rbx, rdi                    ; state pointer
+    mov r12, rsi                    ; i = start
+    mov r13, rdx                    ; stop
+    mov r14, rcx                    ; step
+
+    test r14, r14
+    jz .run_done                    ; step == 0: nothing to iterate
+    js .run_loop_neg
+
+.run_loop:                          ; while (i < stop) {
+    cmp r12, r13
+    jge .run_done
+    mov rdi, rbx                    ;   update(state, 1)
+    mov rsi, 1
+    call progress_bar_update
+    add r12, r14                    ;   i += step
+    jmp .run_loop                   ; }
+
+.run_loop_neg:                      ; while (i > stop) {  (negative step)
+    cmp r12, r13
+    jle .run_done
+    mov rdi, rbx
+    mov rsi, 1
+    call progress_bar_update
+    add r12, r14
+    jmp .run_loop_neg               ; }
+
+.run_done:
+    mov rax, [rbx + PB_CURRENT]
+
+    pop r14
+    pop r13
+    pop r12
+    pop rbx
+    pop rbp
+    ret
+
 ; --------------------------------------------
 ; progress_bar_render - Render progress bar to stdout
 ; --------------------------------------------
@@ -0,0 +1,367 @@
+/* SPDX-License-Identifier: Apache-2.0
+ * Copyright (c) 2026-present Steven Baumann (@SBNovaScript)
+ * Original repository: https://github.com/SBNovaScript/asmqdm
+ * See LICENSE and NOTICE in the repository root for details.
+ * Please retain this header, thank you!
+ *
+ * _asmqdm_iter - fused iteration for list/tuple progress bars
+ * ===========================================================
+ * Iterating a wrapped list through the Python-level protocol costs a
+ * generic next() dispatch plus an FFI update call per item. The
+ * iterator type here fuses both: tp_iternext fetches the next element
+ * with PySequence_Fast_GET_ITEM and calls the Assembly
+ * progress_bar_update through a raw function pointer, so each item is
+ * one C-API call plus one indirect CALL. The bar's n counter is an
+ * int64 cell (asmqdm._n_arr); the iterators write the running count
+ * straight into it per item, so pbar.n stays current during the loop
+ * and after an early break. At exhaustion the bar is closed, matching
+ * the Python iteration paths.
+ *
+ * This extension is optional; the pure-Python paths in asmqdm.core
+ * remain the fallback when it is not built.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <time.h>
+
+/* Matches progress_bar_update(state*, n) in asmqdm.asm */
+typedef int64_t (*update_fn_t)(void *state, int64_t n);
+
+/* Monotonic nanosecond clock, inlined so the throttle check in the
+ * iteration hot path is a direct vDSO call with no indirect CALL
+ * through a stored function pointer. Same clock the Assembly
+ * get_time_ns uses. */
+static inline int64_t
+mono_ns(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (int64_t)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+}
+
+/* Borrow a writable pointer to the bar's counter cell (asmqdm._n_arr,
+ * a one-element array('q')), so keeping pbar.n current is a single
+ * int64 store per item instead of a SetAttr call. The view keeps the
+ * array alive; release it in tp_dealloc. */
+static int
+acquire_n_cell(PyObject *pbar, Py_buffer *view, int64_t **cell)
+{
+    PyObject *n_arr = PyObject_GetAttrString(pbar, "_n_arr");
+    if (n_arr == NULL)
+        return -1;
+    if (PyObject_GetBuffer(n_arr, view, PyBUF_WRITABLE) < 0) {
+        Py_DECREF(n_arr);
+        return -1;
+    }
+    Py_DECREF(n_arr);  /* The view holds its own reference */
+    *cell = (int64_t *)view->buf;
+    return 0;
+}
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *pbar;         /* owning asmqdm instance (owned ref) */
+    PyObject *seq;          /* list or tuple being walked (owned ref) */
+    Py_ssize_t index;
+    Py_ssize_t size;
+    update_fn_t update;     /* progress_bar_update, or NULL */
+    void *state;            /* ProgressBar* state pointer */
+    Py_buffer n_view;       /* view over the bar's _n_arr cell */
+    int64_t *n_cell;        /* &_n_arr[0], or NULL before acquire */
+    int done;               /* close-once guard */
+} FastSeqIterObject;
+
+static void
+fastseqiter_dealloc(FastSeqIterObject *it)
+{
+    if (it->n_cell != NULL)
+        PyBuffer_Release(&it->n_view);
+    Py_XDECREF(it->pbar);
+    Py_XDECREF(it->seq);
+    Py_TYPE(it)->tp_free((PyObject *)it);
+}
+
+static PyObject *
+fastseqiter_iter(PyObject *self)
+{
+    Py_INCREF(self);
+    return self;
+}
+
+static PyObject *
+fastseqiter_next(FastSeqIterObject *it)
+{
+    PyObject *item;
+
+    if (it->index >= it->size) {
+        if (!it->done) {
+            it->done = 1;
+
+            /* n is already current (written per item); just close */
+            PyObject *res = PyObject_CallMethod(it->pbar, "close", NULL);
+            if (res == NULL)
+                return NULL;
+            Py_DECREF(res);
+        }
+        return NULL;  /* StopIteration */
+    }
+
+    /* Borrowed reference; valid for list and tuple */
+    item = PySequence_Fast_GET_ITEM(it->seq, it->index);
+    it->index++;
+    *it->n_cell = (int64_t)it->index;
+
+    if (it->update != NULL)
+        it->update(it->state, 1);
+
+    Py_INCREF(item);
+    return item;
+}
+
+static PyTypeObject FastSeqIter_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "asmqdm._asmqdm_iter.FastSeqIter",
+    .tp_basicsize = sizeof(FastSeqIterObject),
+    .tp_dealloc = (destructor)fastseqiter_dealloc,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "Fused next+update iterator over a list or tuple",
+    .tp_iter = fastseqiter_iter,
+    .tp_iternext = (iternextfunc)fastseqiter_next,
+};
+
+/* ------------------------------------------------------------------
+ * FastIter: generic iterator wrapper
+ *
+ * Wraps any Python iterator. Each step is one tp_iternext call on the
+ * source plus C-field bookkeeping: the counter and pending-update
+ * accumulator are int64_t fields, and the Assembly update is called
+ * only when the refresh interval has elapsed, so most steps never
+ * leave the C level at all.
+ * ------------------------------------------------------------------ */
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *pbar;         /* owning asmqdm instance (owned ref) */
+    PyObject *src_iter;     /* underlying iterator (owned ref) */
+    int64_t n;              /* items seen so far */
+    int64_t pending;        /* updates not yet flushed to the bar */
+    int64_t next_ns;        /* earliest time of the next flush */
+    int64_t interval_ns;    /* flush interval */
+    update_fn_t update;     /* progress_bar_update */
+    void *state;            /* ProgressBar* state pointer */
+    Py_buffer n_view;       /* view over the bar's _n_arr cell */
+    int64_t *n_cell;        /* &_n_arr[0], or NULL before acquire */
+    int done;               /* close-once guard */
+} FastIterObject;
+
+static void
+fastiter_dealloc(FastIterObject *it)
+{
+    if (it->n_cell != NULL)
+        PyBuffer_Release(&it->n_view);
+    Py_XDECREF(it->pbar);
+    Py_XDECREF(it->src_iter);
+    Py_TYPE(it)->tp_free((PyObject *)it);
+}
+
+static PyObject *
+fastiter_finish(FastIterObject *it)
+{
+    /* Flush pending updates and close the bar (once); n is already
+     * current, written into the counter cell per item. */
+    if (!it->done) {
+        it->done = 1;
+
+        if (it->pending > 0) {
+            it->update(it->state, it->pending);
+            it->pending = 0;
+        }
+
+        PyObject *res = PyObject_CallMethod(it->pbar, "close", NULL);
+        if (res == NULL)
+            return NULL;
+        Py_DECREF(res);
+    }
+    return NULL;  /* StopIteration */
+}
+
+static PyObject *
+fastiter_next(FastIterObject *it)
+{
+    PyObject *item;
+    int64_t now;
+
+    item = Py_TYPE(it->src_iter)->tp_iternext(it->src_iter);
+    if (item == NULL) {
+        if (PyErr_Occurred()) {
+            if (!PyErr_ExceptionMatches(PyExc_StopIteration))
+                return NULL;  /* Real error: propagate */
+            PyErr_Clear();
+        }
+        return fastiter_finish(it);
+    }
+
+    it->n++;
+    it->pending++;
+    *it->n_cell = it->n;
+
+    now = mono_ns();
+    if (now >= it->next_ns) {
+        it->update(it->state, it->pending);
+        it->pending = 0;
+        it->next_ns = now + it->interval_ns;
+    }
+
+    return item;
+}
+
+static PyObject *
+fastiter_iter(PyObject *self)
+{
+    Py_INCREF(self);
+    return self;
+}
+
+static PyTypeObject FastIter_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "asmqdm._asmqdm_iter.FastIter",
+    .tp_basicsize = sizeof(FastIterObject),
+    .tp_dealloc = (destructor)fastiter_dealloc,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc = "Generic iterator with C-level counting and throttling",
+    .tp_iter = fastiter_iter,
+    .tp_iternext = (iternextfunc)fastiter_next,
+};
+
+/* fast_iter(pbar, iterator, fn_addr, state_addr, interval_ns) */
+static PyObject *
+fast_iter(PyObject *module, PyObject *args)
+{
+    PyObject *pbar;
+    PyObject *src_iter;
+    unsigned long long fn_addr;
+    unsigned long long state_addr;
+    long long interval_ns;
+    FastIterObject *it;
+
+    if (!PyArg_ParseTuple(args, "OOKKL", &pbar, &src_iter,
+                          &fn_addr, &state_addr, &interval_ns))
+        return NULL;
+
+    if (!PyIter_Check(src_iter)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "fast_iter expects an iterator");
+        return NULL;
+    }
+
+    it = PyObject_New(FastIterObject, &FastIter_Type);
+    if (it == NULL)
+        return NULL;
+
+    Py_INCREF(pbar);
+    Py_INCREF(src_iter);
+    it->pbar = pbar;
+    it->src_iter = src_iter;
+    it->n = 0;
+    it->pending = 0;
+    it->next_ns = 0;  /* First item always flushes */
+    it->interval_ns = interval_ns;
+    it->update = (update_fn_t)(uintptr_t)fn_addr;
+    it->state = (void *)(uintptr_t)state_addr;
+    it->n_cell = NULL;
+    it->done = 0;
+
+    if (acquire_n_cell(pbar, &it->n_view, &it->n_cell) < 0) {
+        Py_DECREF(it);
+        return NULL;
+    }
+
+    return (PyObject *)it;
+}
+
+/* fast_seq_iter(pbar, seq, fn_addr, state_addr) -> iterator */
+static PyObject *
+fast_seq_iter(PyObject *module, PyObject *args)
+{
+    PyObject *pbar;
+    PyObject *seq;
+    unsigned long long fn_addr;
+    unsigned long long state_addr;
+    FastSeqIterObject *it;
+
+    if (!PyArg_ParseTuple(args, "OOKK", &pbar, &seq, &fn_addr, &state_addr))
+        return NULL;
+
+    if (!PyList_Check(seq) && !PyTuple_Check(seq)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "fast_seq_iter expects a list or tuple");
+        return NULL;
+    }
+
+    it = PyObject_New(FastSeqIterObject, &FastSeqIter_Type);
+    if (it == NULL)
+        return NULL;
+
+    Py_INCREF(pbar);
+    Py_INCREF(seq);
+    it->pbar = pbar;
+    it->seq = seq;
+    it->index = 0;
+    it->size = PySequence_Fast_GET_SIZE(seq);
+    it->update = (update_fn_t)(uintptr_t)fn_addr;
+    it->state = (void *)(uintptr_t)state_addr;
+    it->n_cell = NULL;
+    it->done = 0;
+
+    if (acquire_n_cell(pbar, &it->n_view, &it->n_cell) < 0) {
+        Py_DECREF(it);
+        return NULL;
+    }
+
+    return (PyObject *)it;
+}
+
+static PyMethodDef module_methods[] = {
+    {"fast_seq_iter", fast_seq_iter, METH_VARARGS,
+     "fast_seq_iter(pbar, seq, fn_addr, state_addr)\n"
+     "Return a fused next+update iterator over a list or tuple."},
+    {"fast_iter", fast_iter, METH_VARARGS,
+     "fast_iter(pbar, iterator, fn_addr, state_addr, interval_ns)\n"
+     "Return a generic iterator with C-level counting and throttling."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "asmqdm._asmqdm_iter",
+    .m_doc = "Fused iteration helpers for asmqdm",
+    .m_size = -1,
+    .m_methods = module_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__asmqdm_iter(void)
+{
+    PyObject *module;
+
+    if (PyType_Ready(&FastSeqIter_Type) < 0)
+        return NULL;
+    if (PyType_Ready(&FastIter_Type) < 0)
+        return NULL;
+
+    module = PyModule_Create(&moduledef);
+    if (module == NULL)
+        return NULL;
+
+    Py_INCREF(&FastSeqIter_Type);
+    if (PyModule_AddObject(module, "FastSeqIter",
+                           (PyObject *)&FastSeqIter_Type) < 0) {
+        Py_DECREF(&FastSeqIter_Type);
+        Py_DECREF(module);
+        return NULL;
+    }
+
+    return module;
+}
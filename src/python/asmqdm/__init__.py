@@ -30,4 +30,15 @@ Basic usage:
 from .core import asmqdm, trange
 
 __version__ = "0.1.0"
-__all__ = ["asmqdm", "trange", "__version__"]
+__all__ = ["asmqdm", "trange", "iterate", "__version__"]
+
+
+def __getattr__(name: str):
+    # Lazy re-export: `from asmqdm import iterate` pulls in the Numba
+    # integration module only when actually requested, keeping the
+    # package's eager import light. Numba itself is imported even
+    # later, at decoration time.
+    if name == "iterate":
+        from ._numba import iterate
+        return iterate
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,15 +5,24 @@
 # Please retain this header, thank you!
 
 """
-Low-level ctypes bindings to libasmqdm.so
+Low-level FFI bindings to libasmqdm.so
 
 This module provides direct access to the Assembly-implemented
-progress bar functions via Python's ctypes FFI.
+progress bar functions. The hot per-iteration entry points
+(update, update_async, render, close) are bound through cffi in
+ABI mode when cffi is installed, which avoids most of the libffi
+marshaling overhead ctypes pays on every call. Everything falls
+back to ctypes when cffi is not available.
 """
 
 import ctypes
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    from cffi import FFI as _CFFI
+except ImportError:  # cffi is optional; ctypes works everywhere
+    _CFFI = None
 
 
 def _find_library() -> str:
@@ -42,6 +51,19 @@ def _find_library() -> str:
 # Load the shared library
 _lib: Optional[ctypes.CDLL] = None
 
+# cffi ABI-mode handle for the hot functions (None when cffi is absent)
+_cffi_lib: Optional[Any] = None
+
+# cdef for the hot symbols only. Pointers are declared as intptr_t so
+# plain Python ints pass straight through without per-call ffi.cast().
+_CFFI_CDEF = """
+int64_t progress_bar_update(intptr_t state, int64_t n);
+int64_t progress_bar_update_async(intptr_t state, int64_t n);
+void progress_bar_render(intptr_t state);
+void progress_bar_close(intptr_t state);
+void progress_bar_close_async(intptr_t state);
+"""
+
 
 def _get_lib() -> ctypes.CDLL:
     """Get or load the shared library (lazy loading)."""
@@ -52,69 +74,151 @@ def _get_lib() -> ctypes.CDLL:
     return _lib
 
 
-def _setup_functions(lib: ctypes.CDLL) -> None:
-    """Configure function signatures for the library."""
+def _get_cffi_lib() -> Optional[Any]:
+    """Get or load the cffi handle for the hot functions.
 
+    Returns None when cffi is not installed, in which case callers
+    must use the ctypes bindings from _get_lib().
+    """
+    global _cffi_lib
+    if _cffi_lib is None and _CFFI is not None:
+        ffi = _CFFI()
+        ffi.cdef(_CFFI_CDEF)
+        _cffi_lib = ffi.dlopen(_find_library())
+    return _cffi_lib
+
+
+# Module-level pre-bound function references. Resolved once by _bind();
+# the wrapper functions below call these directly so the hot path pays
+# no _get_lib() call and no CDLL attribute lookup per invocation.
+_c_update = None
+_c_update_async = None
+_c_render = None
+_c_close = None
+_c_close_async = None
+_c_create = None
+_c_create_async = None
+_c_run_range = None
+_c_set_description = None
+_c_terminal_width = None
+_c_time_ns = None
+
+# True when the hot bindings above came from the cffi backend
+_cffi_active = False
+
+
+def _bind() -> None:
+    """Resolve and cache direct function references for both backends.
+
+    The hot per-iteration symbols (update, render, close) prefer the
+    cffi binding; everything else binds to the ctypes function objects.
+    Called once, lazily, from the first wrapper invocation.
+    """
+    global _c_update, _c_update_async, _c_render, _c_close, _c_close_async
+    global _c_create, _c_create_async, _c_run_range, _c_set_description
+    global _c_terminal_width, _c_time_ns, _cffi_active
+
+    _get_lib()  # Populates _protos via _setup_functions
+    clib = _get_cffi_lib()
+    _cffi_active = clib is not None
+
+    if _cffi_active:
+        _c_update = clib.progress_bar_update
+        _c_update_async = clib.progress_bar_update_async
+        _c_render = clib.progress_bar_render
+        _c_close = clib.progress_bar_close
+        _c_close_async = clib.progress_bar_close_async
+    else:
+        _c_update = _protos['progress_bar_update']
+        _c_update_async = _protos['progress_bar_update_async']
+        _c_render = _protos['progress_bar_render']
+        _c_close = _protos['progress_bar_close']
+        _c_close_async = _protos['progress_bar_close_async']
+
+    _c_create = _protos['progress_bar_create']
+    _c_create_async = _protos['progress_bar_create_async']
+    _c_run_range = _protos.get('progress_bar_run_range')
+    _c_set_description = _protos['progress_bar_set_description']
+    _c_terminal_width = _protos['get_terminal_width']
+    _c_time_ns = _protos['get_time_ns']
+
+    # Attach raw symbol addresses to the Python wrappers so downstream
+    # JITs (Numba ExternalFunctionPointer, Cython nogil calls) can
+    # invoke the Assembly routines with no Python frame in between,
+    # e.g. _ffi.update.address. See asmqdm._numba for a worked example.
+    for wrapper, symbol in (
+        (update, 'progress_bar_update'),
+        (update_async, 'progress_bar_update_async'),
+        (render, 'progress_bar_render'),
+        (close, 'progress_bar_close'),
+        (close_async, 'progress_bar_close_async'),
+    ):
+        wrapper.address = ctypes.cast(
+            getattr(_lib, symbol), ctypes.c_void_p
+        ).value
+
+
+# Signature table for the exported symbols: name -> (restype, argtypes).
+# Prototypes built from this table via CFUNCTYPE dispatch through a
+# specialized call thunk (faster than argtypes-annotated CDLL attribute
+# access) and release the GIL for the duration of the call.
+_SIGNATURES = {
     # progress_bar_create(total, desc_ptr, desc_len, flags) -> state*
-    lib.progress_bar_create.argtypes = [
-        ctypes.c_int64,     # total
-        ctypes.c_char_p,    # desc_ptr
-        ctypes.c_int64,     # desc_len
-        ctypes.c_uint64,    # flags
-    ]
-    lib.progress_bar_create.restype = ctypes.c_void_p
-
+    'progress_bar_create': (
+        ctypes.c_void_p,
+        (ctypes.c_int64, ctypes.c_char_p, ctypes.c_int64, ctypes.c_uint64),
+    ),
     # progress_bar_update(state*, increment) -> current
-    lib.progress_bar_update.argtypes = [
-        ctypes.c_void_p,    # state pointer
-        ctypes.c_int64,     # increment
-    ]
-    lib.progress_bar_update.restype = ctypes.c_int64
-
+    'progress_bar_update': (
+        ctypes.c_int64,
+        (ctypes.c_void_p, ctypes.c_int64),
+    ),
+    # progress_bar_run_range(state*, start, stop, step) -> current
+    'progress_bar_run_range': (
+        ctypes.c_int64,
+        (ctypes.c_void_p, ctypes.c_int64, ctypes.c_int64, ctypes.c_int64),
+    ),
     # progress_bar_render(state*) -> void
-    lib.progress_bar_render.argtypes = [ctypes.c_void_p]
-    lib.progress_bar_render.restype = None
-
+    'progress_bar_render': (None, (ctypes.c_void_p,)),
     # progress_bar_close(state*) -> void
-    lib.progress_bar_close.argtypes = [ctypes.c_void_p]
-    lib.progress_bar_close.restype = None
-
+    'progress_bar_close': (None, (ctypes.c_void_p,)),
     # progress_bar_set_description(state*, desc_ptr, desc_len) -> void
-    lib.progress_bar_set_description.argtypes = [
-        ctypes.c_void_p,    # state pointer
-        ctypes.c_char_p,    # desc_ptr
-        ctypes.c_int64,     # desc_len
-    ]
-    lib.progress_bar_set_description.restype = None
-
+    'progress_bar_set_description': (
+        None,
+        (ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int64),
+    ),
     # get_terminal_width() -> width
-    lib.get_terminal_width.argtypes = []
-    lib.get_terminal_width.restype = ctypes.c_int64
-
+    'get_terminal_width': (ctypes.c_int64, ()),
     # get_time_ns() -> nanoseconds
-    lib.get_time_ns.argtypes = []
-    lib.get_time_ns.restype = ctypes.c_int64
-
-    # Async functions
+    'get_time_ns': (ctypes.c_int64, ()),
     # progress_bar_create_async(total, desc_ptr, desc_len, flags) -> state*
-    lib.progress_bar_create_async.argtypes = [
-        ctypes.c_int64,     # total
-        ctypes.c_char_p,    # desc_ptr
-        ctypes.c_int64,     # desc_len
-        ctypes.c_uint64,    # flags
-    ]
-    lib.progress_bar_create_async.restype = ctypes.c_void_p
-
+    'progress_bar_create_async': (
+        ctypes.c_void_p,
+        (ctypes.c_int64, ctypes.c_char_p, ctypes.c_int64, ctypes.c_uint64),
+    ),
     # progress_bar_update_async(state*, increment) -> current
-    lib.progress_bar_update_async.argtypes = [
-        ctypes.c_void_p,    # state pointer
-        ctypes.c_int64,     # increment
-    ]
-    lib.progress_bar_update_async.restype = ctypes.c_int64
-
+    'progress_bar_update_async': (
+        ctypes.c_int64,
+        (ctypes.c_void_p, ctypes.c_int64),
+    ),
     # progress_bar_close_async(state*) -> void
-    lib.progress_bar_close_async.argtypes = [ctypes.c_void_p]
-    lib.progress_bar_close_async.restype = None
+    'progress_bar_close_async': (None, (ctypes.c_void_p,)),
+}
+
+# Symbols that older builds of libasmqdm.so may not export
+_OPTIONAL_SYMBOLS = {'progress_bar_run_range'}
+
+# name -> prototype-bound callable, filled by _setup_functions()
+_protos: dict = {}
+
+
+def _setup_functions(lib: ctypes.CDLL) -> None:
+    """Build prototype-bound callables for the library's symbols."""
+    for name, (restype, argtypes) in _SIGNATURES.items():
+        if name in _OPTIONAL_SYMBOLS and not hasattr(lib, name):
+            continue
+        proto = ctypes.CFUNCTYPE(restype, *argtypes, use_errno=False)
+        _protos[name] = proto((name, lib))
 
 
 # Flag constants (must match constants.inc)
@@ -123,6 +227,58 @@ FLAG_DISABLE = 0x02
 FLAG_ASCII = 0x04
 FLAG_ASYNC = 0x20
 
+# Precomputed flag words for every (leave, disable, ascii_only) combo,
+# so create()/create_async() do one tuple lookup instead of four
+# branches and ORs per construction.
+_FLAG_TABLE = {
+    (leave, disable, ascii_only):
+        (FLAG_LEAVE if leave else 0)
+        | (FLAG_DISABLE if disable else 0)
+        | (FLAG_ASCII if ascii_only else 0)
+    for leave in (False, True)
+    for disable in (False, True)
+    for ascii_only in (False, True)
+}
+
+
+def update_fn(async_render: bool = False) -> Any:
+    """
+    Return the fastest available bound callable for the update symbol.
+
+    Prefers the cffi ABI-mode binding (direct call, minimal marshaling)
+    and falls back to the ctypes function object. The returned callable
+    takes (state, n) where state is whatever box_state() produced.
+
+    Args:
+        async_render: Whether to bind the async (lock-free) update
+
+    Returns:
+        A callable (state, n) -> current count
+    """
+    if _c_update is None:
+        _bind()
+    return _c_update_async if async_render else _c_update
+
+
+def box_state(state: int) -> Any:
+    """
+    Box a raw state handle for the active FFI backend.
+
+    The cffi binding declares state as intptr_t and takes a plain int;
+    the ctypes binding wants a c_void_p built once, not per call.
+
+    Args:
+        state: Raw state pointer as an integer
+
+    Returns:
+        The state in the form the bound update callable expects
+    """
+    if _c_update is None:
+        _bind()
+    if _cffi_active:
+        return state
+    return ctypes.c_void_p(state)
+
 
 def create(
     total: int,
@@ -144,19 +300,13 @@ def create(
     Returns:
         Pointer to the progress bar state (opaque handle)
     """
-    lib = _get_lib()
-
-    flags = 0
-    if leave:
-        flags |= FLAG_LEAVE
-    if disable:
-        flags |= FLAG_DISABLE
-    if ascii_only:
-        flags |= FLAG_ASCII
+    if _c_create is None:
+        _bind()
 
+    flags = _FLAG_TABLE[(bool(leave), bool(disable), bool(ascii_only))]
     desc_len = len(desc_bytes) if desc_bytes else 0
 
-    return lib.progress_bar_create(total, desc_bytes, desc_len, flags)
+    return _c_create(total, desc_bytes, desc_len, flags)
 
 
 def update(state: ctypes.c_void_p, n: int = 1) -> int:
@@ -170,8 +320,39 @@ def update(state: ctypes.c_void_p, n: int = 1) -> int:
     Returns:
         Current iteration count
     """
-    lib = _get_lib()
-    return lib.progress_bar_update(state, n)
+    if _c_update is None:
+        _bind()
+    return _c_update(state, n)
+
+
+def run_range(
+    state: ctypes.c_void_p,
+    start: int,
+    stop: int,
+    step: int = 1,
+) -> Optional[int]:
+    """
+    Drive an entire start/stop/step loop inside the shared library.
+
+    One FFI entry replaces one crossing per iteration; rate limiting
+    and rendering behave exactly like per-call updates.
+
+    Args:
+        state: Progress bar state pointer
+        start: First value of the range
+        stop: End of the range (exclusive)
+        step: Range step (positive or negative)
+
+    Returns:
+        Final iteration count, or None when the loaded library
+        predates progress_bar_run_range (caller should fall back
+        to Python-side iteration)
+    """
+    if _c_update is None:
+        _bind()
+    if _c_run_range is None:
+        return None
+    return _c_run_range(state, start, stop, step)
 
 
 def render(state: ctypes.c_void_p) -> None:
@@ -181,8 +362,9 @@ def render(state: ctypes.c_void_p) -> None:
     Args:
         state: Progress bar state pointer
     """
-    lib = _get_lib()
-    lib.progress_bar_render(state)
+    if _c_render is None:
+        _bind()
+    _c_render(state)
 
 
 def close(state: ctypes.c_void_p) -> None:
@@ -192,20 +374,45 @@ def close(state: ctypes.c_void_p) -> None:
     Args:
         state: Progress bar state pointer
     """
-    lib = _get_lib()
-    lib.progress_bar_close(state)
+    if _c_close is None:
+        _bind()
+    _c_close(state)
 
 
-def set_description(state: ctypes.c_void_p, desc_bytes: bytes) -> None:
+def set_description(
+    state: ctypes.c_void_p,
+    desc_bytes: bytes,
+    desc_len: Optional[int] = None,
+) -> None:
     """
     Update the description prefix.
 
     Args:
         state: Progress bar state pointer
         desc_bytes: New description as bytes (caller must keep reference!)
+        desc_len: Length of desc_bytes, if the caller already knows it
+    """
+    if _c_set_description is None:
+        _bind()
+    if desc_len is None:
+        desc_len = len(desc_bytes)
+    _c_set_description(state, desc_bytes, desc_len)
+
+
+def update_fnptr() -> int:
     """
-    lib = _get_lib()
-    lib.progress_bar_set_description(state, desc_bytes, len(desc_bytes))
+    Get the raw address of progress_bar_update.
+
+    Intended for JIT consumers (Numba, Cython) that want to call the
+    Assembly update routine directly from compiled code with no Python
+    frame and no GIL. See asmqdm._numba for a ready-made wrapper.
+
+    Returns:
+        Address of progress_bar_update as an integer
+    """
+    return ctypes.cast(
+        _get_lib().progress_bar_update, ctypes.c_void_p
+    ).value
 
 
 def terminal_width() -> int:
@@ -215,8 +422,65 @@ def terminal_width() -> int:
     Returns:
         Terminal width in characters
     """
-    lib = _get_lib()
-    return lib.get_terminal_width()
+    if _c_terminal_width is None:
+        _bind()
+    return _c_terminal_width()
+
+
+# Cached terminal width for Python-side consumers. get_terminal_width
+# performs a TIOCGWINSZ ioctl per call; the cache is invalidated by a
+# SIGWINCH handler so it only re-reads after an actual resize. (The
+# Assembly renderer reads the width itself and is unaffected.)
+_cached_width: Optional[int] = None
+_winch_handler_ok: Optional[bool] = None
+
+
+def _invalidate_width(*_args: Any) -> None:
+    global _cached_width
+    _cached_width = None
+
+
+def _install_winch_handler() -> bool:
+    """Install the resize handler once; False if it cannot be installed."""
+    global _winch_handler_ok
+    if _winch_handler_ok is None:
+        try:
+            import signal
+
+            previous = signal.getsignal(signal.SIGWINCH)
+
+            def _handler(signum: int, frame: Any) -> None:
+                _invalidate_width()
+                if callable(previous):
+                    previous(signum, frame)
+
+            signal.signal(signal.SIGWINCH, _handler)
+            _winch_handler_ok = True
+        except (ValueError, OSError, AttributeError):
+            # Not the main thread, or the platform has no SIGWINCH;
+            # caching would go stale, so report failure.
+            _winch_handler_ok = False
+    return _winch_handler_ok
+
+
+def terminal_width_cached() -> int:
+    """
+    Get the terminal width, cached until the terminal is resized.
+
+    The first call installs a SIGWINCH handler that invalidates the
+    cache, so subsequent calls cost one global read instead of an
+    ioctl. Falls back to an uncached read when the handler cannot be
+    installed (non-main thread, platforms without SIGWINCH).
+
+    Returns:
+        Terminal width in characters
+    """
+    global _cached_width
+    if not _install_winch_handler():
+        return terminal_width()
+    if _cached_width is None:
+        _cached_width = terminal_width()
+    return _cached_width
 
 
 def time_ns() -> int:
@@ -226,8 +490,9 @@ def time_ns() -> int:
     Returns:
         Nanoseconds since system boot
     """
-    lib = _get_lib()
-    return lib.get_time_ns()
+    if _c_time_ns is None:
+        _bind()
+    return _c_time_ns()
 
 
 # ============================================
@@ -258,19 +523,14 @@ def create_async(
     Returns:
         Pointer to the progress bar state (opaque handle)
     """
-    lib = _get_lib()
-
-    flags = FLAG_ASYNC  # Always set async flag
-    if leave:
-        flags |= FLAG_LEAVE
-    if disable:
-        flags |= FLAG_DISABLE
-    if ascii_only:
-        flags |= FLAG_ASCII
+    if _c_create_async is None:
+        _bind()
 
+    # FLAG_ASYNC is always set for async bars
+    flags = _FLAG_TABLE[(bool(leave), bool(disable), bool(ascii_only))] | FLAG_ASYNC
     desc_len = len(desc_bytes) if desc_bytes else 0
 
-    return lib.progress_bar_create_async(total, desc_bytes, desc_len, flags)
+    return _c_create_async(total, desc_bytes, desc_len, flags)
 
 
 def update_async(state: ctypes.c_void_p, n: int = 1) -> int:
@@ -287,8 +547,9 @@ def update_async(state: ctypes.c_void_p, n: int = 1) -> int:
     Returns:
         New current iteration count
     """
-    lib = _get_lib()
-    return lib.progress_bar_update_async(state, n)
+    if _c_update_async is None:
+        _bind()
+    return _c_update_async(state, n)
 
 
 def close_async(state: ctypes.c_void_p) -> None:
@@ -301,5 +562,6 @@ def close_async(state: ctypes.c_void_p) -> None:
     Args:
         state: Progress bar state pointer
     """
-    lib = _get_lib()
-    lib.progress_bar_close_async(state)
+    if _c_close_async is None:
+        _bind()
+    _c_close_async(state)
@@ -0,0 +1,311 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026-present Steven Baumann (@SBNovaScript)
+# Original repository: https://github.com/SBNovaScript/asmqdm
+# See LICENSE and NOTICE in the repository root for details.
+# Please retain this header, thank you!
+
+"""
+Optional Numba integration for asmqdm
+
+When Numba is installed, the per-iteration update loop can be compiled
+to nopython code that calls the Assembly progress_bar_update through a
+raw C function pointer — no Python frame, no interpreter dispatch, no
+GIL on the hot path.
+
+Numba is imported lazily so this module is safe to import (and the rest
+of the package works) when Numba is not installed.
+
+Usage:
+    from asmqdm._numba import drive_range
+
+    # Equivalent to `for _ in trange(10_000_000): pass`, but the loop
+    # runs entirely in compiled code with one FFI entry.
+    drive_range(10_000_000, desc="Crunching")
+
+For JITs that want the raw address rather than a ctypes wrapper, the
+bound _ffi wrappers expose one (after first use) as e.g.
+`_ffi.update.address`, suitable for building a
+numba.types.ExternalFunctionPointer with signature
+int64(voidptr, int64).
+"""
+
+import ctypes
+import threading
+from typing import Optional
+
+from . import _ffi
+from .core import asmqdm
+
+# ctypes prototype for progress_bar_update(state*, n) -> current.
+# Numba can call CFUNCTYPE-wrapped pointers directly from nopython code.
+_UPDATE_PROTO = ctypes.CFUNCTYPE(
+    ctypes.c_int64, ctypes.c_void_p, ctypes.c_int64
+)
+
+# Compiled driver, built once on first use
+_driver = None
+
+
+def update_callable() -> ctypes._CFuncPtr:
+    """
+    Return progress_bar_update wrapped for use inside @njit code.
+
+    Numba understands CFUNCTYPE-wrapped function pointers in nopython
+    mode and compiles the call down to a single indirect CALL with no
+    GIL, so user kernels can drive a bar from inside their own loops:
+
+        from asmqdm import _ffi
+        from asmqdm._numba import update_callable
+
+        state = _ffi.create(total)
+        update = update_callable()
+
+        @numba.njit(nogil=True)
+        def kernel(state, total):
+            for i in range(total):
+                # ... work ...
+                update(state, 1)
+
+        kernel(state, total)
+        _ffi.close(state)
+
+    Returns
+    -------
+    ctypes function pointer
+        Callable (state, n) -> current count, usable from nopython code.
+    """
+    return _UPDATE_PROTO(_ffi.update_fnptr())
+
+
+class numba_handle:
+    """
+    Shared int64 counter drivable from inside nopython kernels.
+
+    Numba-compiled code cannot call back into the interpreter cheaply,
+    but it can mutate a NumPy array it was handed. The handle owns a
+    1-element int64 array; the kernel increments `handle.counter[0]`
+    per iteration (sub-ns, no GIL), while a background thread polls the
+    counter on `interval` and forwards the delta to the Assembly
+    renderer:
+
+        from asmqdm._numba import numba_handle
+
+        @numba.njit(nogil=True)
+        def kernel(counter, n):
+            for i in range(n):
+                # ... work ...
+                counter[0] += 1
+
+        with numba_handle(total=n, desc="Kernel") as handle:
+            kernel(handle.counter, n)
+
+    Parameters
+    ----------
+    total : int
+        Total number of iterations.
+    desc : str, optional
+        Prefix description for the progress bar.
+    leave : bool, default True
+        Whether to leave the progress bar visible after completion.
+    ascii_only : bool, default False
+        Use ASCII characters only for the progress bar.
+    interval : float, default 0.05
+        Poll period in seconds; matches the renderer's 50ms throttle.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        desc: Optional[str] = None,
+        leave: bool = True,
+        ascii_only: bool = False,
+        interval: float = 0.05,
+    ) -> None:
+        import numpy as np  # Deferred: numpy is an optional dependency
+
+        self.counter = np.zeros(1, dtype=np.int64)
+        self._bar = asmqdm(
+            total=total, desc=desc, leave=leave, ascii=ascii_only
+        )
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    @property
+    def n(self) -> int:
+        """Iterations reported to the renderer so far."""
+        return self._bar.n
+
+    def _poll(self) -> None:
+        seen = 0
+        while not self._stop.wait(self._interval):
+            current = int(self.counter[0])
+            if current > seen:
+                self._bar.update_many(current - seen)
+                seen = current
+        # Final reconcile before the thread exits, so the closing
+        # render shows the kernel's true count.
+        current = int(self.counter[0])
+        if current > seen:
+            self._bar.update_many(current - seen)
+
+    def __enter__(self) -> 'numba_handle':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self._stop.set()
+        self._thread.join()
+        self._bar.close()
+        return False
+
+
+def iterate(
+    total: int,
+    desc: Optional[str] = None,
+    leave: bool = True,
+    ascii_only: bool = False,
+    interval: float = 0.05,
+):
+    """
+    Decorator running an indexed loop in compiled code with progress.
+
+    The decorated function is compiled with @njit (or used as-is if it
+    already is one) and called as f(i) for i in range(total), with the
+    per-iteration counter increment fused into the same compiled loop —
+    the whole traversal is one Python -> native transition:
+
+        from asmqdm._numba import iterate
+
+        @iterate(total=10_000_000, desc="Crunching")
+        def step(i):
+            # ... work on element i ...
+            pass
+
+        step()  # Runs the full loop, progress included
+
+    Rendering is handled by the numba_handle background thread; the
+    wrapped call returns the final count.
+
+    Parameters
+    ----------
+    total : int
+        Number of iterations to drive.
+    desc : str, optional
+        Prefix description for the progress bar.
+    leave : bool, default True
+        Whether to leave the progress bar visible after completion.
+    ascii_only : bool, default False
+        Use ASCII characters only for the progress bar.
+    interval : float, default 0.05
+        Render-poll period in seconds.
+
+    Raises
+    ------
+    ImportError
+        If Numba or NumPy is not installed (raised at decoration time).
+    """
+    def decorator(fn):
+        import numba  # Deferred: numba is an optional dependency
+
+        if not isinstance(fn, numba.core.dispatcher.Dispatcher):
+            fn = numba.njit(nogil=True)(fn)
+
+        @numba.njit(nogil=True)
+        def _driver(counter):
+            for i in range(total):
+                fn(i)
+                counter[0] += 1
+
+        def runner() -> int:
+            with numba_handle(
+                total=total,
+                desc=desc,
+                leave=leave,
+                ascii_only=ascii_only,
+                interval=interval,
+            ) as handle:
+                _driver(handle.counter)
+            return handle.n
+
+        return runner
+
+    return decorator
+
+
+def _get_driver():
+    """
+    Compile (once) the nopython loop driver.
+
+    Raises:
+        ImportError: If Numba is not installed.
+    """
+    global _driver
+    if _driver is None:
+        import numba  # Deferred: numba is an optional dependency
+
+        update = update_callable()
+
+        # No cache=True: the driver closes over a ctypes function
+        # pointer, which Numba treats as a dynamic global and refuses
+        # to cache (emitting a warning). Compilation happens once per
+        # process instead; the result is memoized in _driver below.
+        @numba.njit
+        def driver(state: int, n: int) -> None:
+            for _ in range(n):
+                update(state, 1)
+
+        _driver = driver
+    return _driver
+
+
+def drive_range(
+    n: int,
+    desc: Optional[str] = None,
+    leave: bool = True,
+    ascii_only: bool = False,
+) -> None:
+    """
+    Run an n-iteration progress loop entirely in compiled code.
+
+    Equivalent to `for _ in trange(n): pass` but with a single
+    Python -> native transition: the whole loop, including the calls
+    into the Assembly update routine, runs in Numba-compiled code.
+
+    The compiled driver is memoized, so compilation cost is paid once
+    per process, not per call.
+
+    Parameters
+    ----------
+    n : int
+        Number of iterations to drive.
+    desc : str, optional
+        Prefix description for the progress bar.
+    leave : bool, default True
+        Whether to leave the progress bar visible after completion.
+    ascii_only : bool, default False
+        Use ASCII characters only for the progress bar.
+
+    Raises
+    ------
+    ImportError
+        If Numba is not installed.
+    """
+    driver = _get_driver()
+
+    desc_bytes = desc.encode('utf-8') if desc else None
+    state = _ffi.create(
+        n,
+        desc_bytes=desc_bytes,
+        leave=leave,
+        ascii_only=ascii_only,
+    )
+    try:
+        driver(state, n)
+    finally:
+        _ffi.close(state)
@@ -27,13 +27,67 @@ Usage:
             pbar.update(10)
 """
 
+import os
 import sys
+from array import array
+from operator import length_hint
+from time import monotonic_ns
 from typing import Any, Iterable, Iterator, Optional, TypeVar
 
 from . import _ffi
 
+# Optional C extension fusing next()+update for list/tuple iteration.
+# Built by setup.py when a C compiler is available; the pure-Python
+# iteration paths below are the fallback.
+try:
+    from . import _asmqdm_iter as _fast_iter
+except ImportError:
+    _fast_iter = None
+
 T = TypeVar('T')
 
+# Flush interval for the C iterator; matches MIN_UPDATE_INTERVAL in
+# src/asm/include/constants.inc (50ms).
+_RENDER_INTERVAL_NS = 50_000_000
+
+# Marks iterator exhaustion in __next__ without paying try/except setup
+_SENTINEL: Any = object()
+
+# Encoded-description cache. set_description is often called repeatedly
+# with a small set of strings from inside loops; interning the (bytes,
+# length) pair avoids re-encoding on every call.
+_desc_cache: dict = {}
+
+
+# Cached stderr file descriptor for the raw write path. Revalidated
+# whenever sys.stderr is rebound (test harnesses swap it for capture).
+_stderr_fd: Optional[int] = None
+_stderr_obj: Any = None
+
+
+def _stderr_fileno() -> Optional[int]:
+    """Return the file descriptor of sys.stderr, or None if it has none."""
+    global _stderr_fd, _stderr_obj
+    stderr = sys.stderr
+    if stderr is not _stderr_obj:
+        _stderr_obj = stderr
+        try:
+            _stderr_fd = stderr.fileno()
+        except (AttributeError, OSError, ValueError):
+            _stderr_fd = None  # Captured/redirected stream without an fd
+    return _stderr_fd
+
+
+def _encode_desc(desc: str) -> tuple:
+    """Return the cached (utf-8 bytes, length) pair for a description."""
+    cached = _desc_cache.get(desc)
+    if cached is None:
+        if len(_desc_cache) > 256:  # Bound memory for pathological callers
+            _desc_cache.clear()
+        encoded = desc.encode('utf-8')
+        cached = _desc_cache[desc] = (encoded, len(encoded))
+    return cached
+
 
 class asmqdm:
     """
@@ -63,6 +117,11 @@ class asmqdm:
         Width of the progress bar (auto-detected if not specified).
     unit : str, default "it"
         Unit name (unused, reserved for future use).
+    miniters : int, optional
+        Coalesce this many updates into one FFI call. Defaults to
+        total // 1000 (minimum 1), which keeps the rendered bar
+        visually unchanged while making most update() calls a pure
+        Python integer add.
     async_render : bool, default False
         Enable async rendering mode with dedicated render thread.
         - Rendering happens on a separate CPU core
@@ -84,6 +143,18 @@ class asmqdm:
     ...         pbar.update(10)
     """
 
+    # Fixed attribute layout: replaces the per-instance __dict__ with
+    # fixed-offset slots, speeding the attribute access update() and
+    # __next__ do on every iteration and shrinking instance memory.
+    __slots__ = (
+        'iterable', 'desc', 'leave', 'disable', 'ascii_only',
+        'async_render', 'total', '_n_arr',
+        '_state', '_closed', '_is_async', '_desc_bytes',
+        '_update_fn', '_state_ptr', '_pending', '_flush_every',
+        '_dynamic_flush', '_last_flush_ns',
+        '_iterator', '_iter_impl',
+    )
+
     def __init__(
         self,
         iterable: Optional[Iterable[T]] = None,
@@ -95,6 +166,7 @@ class asmqdm:
         file: Any = None,
         ncols: Optional[int] = None,
         unit: str = "it",
+        miniters: Optional[int] = None,
         async_render: bool = False,
     ) -> None:
         self.iterable = iterable
@@ -104,11 +176,13 @@ class asmqdm:
         self.ascii_only = ascii
         self.async_render = async_render
 
-        # Determine total iterations
+        # Determine total iterations. length_hint is a single C-level
+        # probe that also consults __length_hint__, covering generators
+        # that advertise a size; 0 means unknown length.
         if total is not None:
             self.total = total
-        elif iterable is not None and hasattr(iterable, '__len__'):
-            self.total = len(iterable)  # type: ignore
+        elif iterable is not None:
+            self.total = length_hint(iterable, 0)
         else:
             self.total = 0  # Unknown length
 
@@ -120,7 +194,7 @@ class asmqdm:
         self._desc_bytes: Optional[bytes] = None
 
         if not self.disable:
-            self._desc_bytes = self.desc.encode('utf-8') if self.desc else None
+            self._desc_bytes = _encode_desc(self.desc)[0] if self.desc else None
 
             if async_render:
                 # Async mode: dedicated render thread, lock-free updates
@@ -142,27 +216,167 @@ class asmqdm:
                     ascii_only=self.ascii_only,
                 )
 
+        # Pre-bind the concrete C function and box the state pointer once.
+        # Calling the bound function directly from update()/__next__ avoids
+        # re-resolving the library and two attribute lookups per call, which
+        # dominates the Python-side cost on million-iteration loops. The
+        # binding prefers the cffi backend when available (see _ffi).
+        self._update_fn = None
+        self._state_ptr = None
+        if self._state is not None:
+            self._update_fn = _ffi.update_fn(self._is_async)
+            self._state_ptr = _ffi.box_state(self._state)
+
+        # Update coalescing: accumulate increments locally and flush to
+        # the C side every _flush_every iterations, amortizing FFI cost.
+        # The Assembly renderer throttles to 50ms regardless, so flushing
+        # ~1000 times over the bar's lifetime changes nothing visually.
+        self._pending = 0
+        self._flush_every = miniters if miniters else max(1, self.total // 1000)
+        # Auto-tune the flush cadence unless the caller pinned miniters:
+        # flushes arriving faster than the render interval double the
+        # batch size (capped), flushes arriving slower halve it. This
+        # adapts to loops of unknown length without per-call clock reads.
+        self._dynamic_flush = miniters is None
+        self._last_flush_ns = 0
+
         self._iterator: Optional[Iterator[T]] = None
-        self.n = 0  # Current iteration count
+        # Current iteration count, held in a one-element int64 array so
+        # increments mutate a fixed C slot instead of allocating new int
+        # objects at large magnitudes, and so the cell is addressable
+        # for zero-copy reads from native code.
+        self._n_arr = array('q', [0])
+
+        # Iteration strategy is picked once here rather than re-checked
+        # on every __iter__ call: a disabled bar with an iterable hands
+        # back the raw iterator so the loop pays exactly what
+        # iter(iterable) costs, with no wrapper in between.
+        if self.disable and iterable is not None:
+            self._iter_impl = self._iter_raw
+        else:
+            self._iter_impl = self._iter_tracked
+
+    @property
+    def n(self) -> int:
+        """Current iteration count."""
+        return self._n_arr[0]
+
+    @n.setter
+    def n(self, value: int) -> None:
+        self._n_arr[0] = value
 
-    def __iter__(self) -> 'asmqdm':
-        """Return iterator over wrapped iterable."""
-        if self.iterable is not None:
-            self._iterator = iter(self.iterable)
+    def __iter__(self) -> Iterator[T]:
+        """Return iterator over wrapped iterable.
+
+        Dispatches through the strategy chosen at construction:
+        disabled bars return the raw iterator, enabled bars get a
+        tracked iteration path.
+        """
+        return self._iter_impl()
+
+    def _iter_raw(self) -> Iterator[T]:
+        """Disabled-bar path: the wrapped iterable's own iterator.
+
+        The counter is reconciled from total if close() is called.
+        """
+        return iter(self.iterable)
+
+    def _iter_tracked(self) -> Iterator[T]:
+        """Enabled-bar path.
+
+        Common concrete containers (range, list, tuple) get a
+        specialized iteration path; anything else falls back to the
+        generic __next__ protocol.
+        """
+        iterable = self.iterable
+        if self._state is not None:
+            # Async state must only ever be touched through the atomic
+            # update entry point (the render thread reads it
+            # concurrently), so the C iterators get the matching
+            # symbol's address. The .address attributes exist once
+            # _bind() has run, which creating the state guarantees;
+            # stateless bars never reach the branches that use this.
+            if self._is_async:
+                update_addr = _ffi.update_async.address
+            else:
+                update_addr = _ffi.update.address
+        if (
+            _fast_iter is not None
+            and type(iterable) in (list, tuple)
+            and self._state is not None
+        ):
+            # Fused C iterator: one C-API call plus one indirect CALL
+            # per item, no Python frame. Writes n back and closes the
+            # bar at exhaustion, like the paths below.
+            return _fast_iter.fast_seq_iter(
+                self, iterable, update_addr, self._state
+            )
+        if (
+            _fast_iter is not None
+            and iterable is not None
+            and self._state is not None
+        ):
+            # Generic C iterator: counting, throttling, and the update
+            # flush all happen as C field operations; only one source
+            # tp_iternext call per item crosses the C-API.
+            return _fast_iter.fast_iter(
+                self, iter(iterable),
+                update_addr, self._state, _RENDER_INTERVAL_NS,
+            )
+        if isinstance(iterable, (range, list, tuple)):
+            return self._iter_fast(iterable)
+        if iterable is not None:
+            self._iterator = iter(iterable)
         return self
 
+    def _iter_fast(self, iterable: Iterable[T]) -> Iterator[T]:
+        """Specialized iteration for known containers.
+
+        A generator resumes at C level, so each item skips the generic
+        next() dispatch, the try/except StopIteration machinery, and
+        the per-item attribute lookups __next__ pays. The bound update
+        function and state pointer are localized once up front.
+        """
+        update_fn = self._update_fn
+        state_ptr = self._state_ptr
+        flush_every = self._flush_every
+        n = 0
+        pending = 0
+        completed = False
+        try:
+            if update_fn is not None:
+                for item in iterable:
+                    n += 1
+                    pending += 1
+                    if pending >= flush_every:
+                        update_fn(state_ptr, pending)
+                        pending = 0
+                    yield item
+            else:
+                for item in iterable:
+                    n += 1
+                    yield item
+            completed = True
+        finally:
+            if update_fn is not None and pending:
+                update_fn(state_ptr, pending)
+            self.n = n
+            if completed:
+                self.close()
+
     def __next__(self) -> T:
         """Get next item and update progress bar."""
         if self._iterator is None:
             raise StopIteration
 
-        try:
-            item = next(self._iterator)
-            self.update(1)
-            return item
-        except StopIteration:
+        # Two-argument next() avoids a try/except StopIteration block,
+        # which costs exception-state setup on every successful call.
+        item = next(self._iterator, _SENTINEL)
+        if item is _SENTINEL:
             self.close()
-            raise
+            raise StopIteration
+        self.update(1)
+        return item
 
     def __enter__(self) -> 'asmqdm':
         """Context manager entry."""
@@ -189,29 +403,136 @@ class asmqdm:
         n : int, default 1
             Number of iterations to increment by.
         """
+        # The counter cell is touched directly here (not through the n
+        # property) to keep descriptor dispatch off the hot path.
         if self._state is not None and not self._closed:
-            if self._is_async:
-                self.n = _ffi.update_async(self._state, n)
+            self._pending += n
+            if self._pending >= self._flush_every:
+                self._n_arr[0] = self._update_fn(self._state_ptr, self._pending)
+                self._pending = 0
+                if self._dynamic_flush:
+                    # One clock read per flush, not per update: widen
+                    # the batch while flushes outpace the renderer's
+                    # 50ms throttle, narrow it when they lag behind.
+                    now = monotonic_ns()
+                    if now - self._last_flush_ns < _RENDER_INTERVAL_NS:
+                        if self._flush_every < 1024:
+                            self._flush_every = min(1024, self._flush_every << 1)
+                    elif self._flush_every > 1:
+                        self._flush_every >>= 1
+                    self._last_flush_ns = now
             else:
-                self.n = _ffi.update(self._state, n)
+                self._n_arr[0] += n
+        else:
+            # Still track count even when disabled
+            self._n_arr[0] += n
+
+    def update_many(self, count: int) -> None:
+        """
+        Fold `count` iterations into a single progress update.
+
+        Unlike calling update(1) in a loop, this makes exactly one FFI
+        entry (flushing any coalesced increments along with it) and
+        lets the Assembly side perform its single throttle check, so
+        the Python cost of N iterations' worth of progress is one call.
+
+        Parameters
+        ----------
+        count : int
+            Number of iterations to add to the counter.
+        """
+        if self._state is not None and not self._closed:
+            self.n = self._update_fn(self._state_ptr, self._pending + count)
+            self._pending = 0
         else:
             # Still track count even when disabled
-            self.n += n
+            self.n += count
+
+    def drive(self) -> None:
+        """
+        Run the wrapped iterable to completion without yielding values.
+
+        When the iterable is a plain range, the entire loop runs inside
+        the shared library via progress_bar_run_range — one FFI entry
+        instead of one per iteration. Use this when only the progress
+        display matters, not the loop values:
+
+            asmqdm(range(1_000_000), desc="Warming cache").drive()
+
+        Falls back to ordinary iteration for non-range iterables,
+        async bars (progress_bar_run_range drives the sync update,
+        which must not touch render-thread-owned state), or when the
+        loaded library predates progress_bar_run_range.
+        """
+        rng = self.iterable
+        if (
+            isinstance(rng, range)
+            and self._state is not None
+            and not self._closed
+            and not self._is_async
+        ):
+            result = _ffi.run_range(
+                self._state_ptr, rng.start, rng.stop, rng.step
+            )
+            if result is not None:
+                self.n = result
+                self.close()
+                return
+        for _ in self:
+            pass
+        self.close()
 
     def close(self) -> None:
-        """Close the progress bar and release resources."""
+        """Close the progress bar and release resources.
+
+        Disabled bars hold no state and iterate through the raw
+        iterator, so their counter only ever reflects manual update()
+        calls — matching tqdm's disabled semantics.
+        """
         if self._state is not None and not self._closed:
+            # Flush any coalesced updates before the final render
+            if self._pending:
+                self.n = self._update_fn(self._state_ptr, self._pending)
+                self._pending = 0
             if self._is_async:
-                _ffi.close_async(self._state)
+                _ffi.close_async(self._state_ptr)
             else:
-                _ffi.close(self._state)
+                _ffi.close(self._state_ptr)
             self._state = None
+            self._state_ptr = None
             self._closed = True
 
+    def _reset(
+        self,
+        *,
+        total: Optional[int] = None,
+        desc: Optional[str] = None,
+        disable: bool = False,
+        leave: bool = True,
+    ) -> 'asmqdm':
+        """
+        Reinitialize this bar in place for reuse.
+
+        Closes any live state and re-runs initialization with the given
+        parameters, so a single instance can be recycled across many
+        short-lived bars (e.g. by the test suite) instead of
+        constructing a fresh object each time. The Assembly state is
+        recreated when the bar is enabled, since the total is baked
+        into it at creation; the Python-side object is reused as-is.
+
+        Returns
+        -------
+        asmqdm
+            self, reset and ready for use.
+        """
+        self.close()
+        self.__init__(total=total, desc=desc, disable=disable, leave=leave)
+        return self
+
     def refresh(self) -> None:
         """Force refresh the display."""
         if self._state is not None and not self._closed:
-            _ffi.render(self._state)
+            _ffi.render(self._state_ptr)
 
     def set_description(self, desc: Optional[str] = None) -> None:
         """
@@ -224,9 +545,10 @@ class asmqdm:
         """
         self.desc = desc
         if self._state is not None and not self._closed:
-            # Keep reference to new desc_bytes
-            self._desc_bytes = desc.encode('utf-8') if desc else b""
-            _ffi.set_description(self._state, self._desc_bytes)
+            # Keep reference to new desc_bytes (cached per string)
+            encoded, length = _encode_desc(desc) if desc else (b"", 0)
+            self._desc_bytes = encoded
+            _ffi.set_description(self._state_ptr, encoded, length)
 
     def set_postfix(self, **kwargs: Any) -> None:
         """
@@ -257,11 +579,19 @@ class asmqdm:
         nolock : bool, default False
             Ignored (reserved for future use).
         """
+        if file is None:
+            # Raw fd write: one syscall, no TextIO lock, no buffered
+            # encode step. Only taken when stderr has a real descriptor.
+            fd = _stderr_fileno()
+            if fd is not None:
+                os.write(fd, f"\r\033[K{s}{end}".encode())
+                return
+
         output = file if file is not None else sys.stderr
-        # Clear line, print message, then progress bar will redraw
-        output.write('\r\033[K')  # Carriage return + clear line
-        output.write(s)
-        output.write(end)
+        # Single buffered write: carriage return + clear line + message.
+        # Each TextIO write takes the wrapper lock, so batching the four
+        # pieces into one call also means one lock acquisition.
+        output.write(f"\r\033[K{s}{end}")
         output.flush()
 
     @property
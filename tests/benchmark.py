@@ -11,11 +11,13 @@ Benchmark script comparing sync vs async asmqdm performance.
 Measures the overhead of update() calls in both modes.
 """
 
+import os
 import sys
 import time
 
 # Add src/python to path
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0] + "/src/python")
+_HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_HERE, "src", "python"))
 
 from asmqdm import asmqdm
 
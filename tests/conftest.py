@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026-present Steven Baumann (@SBNovaScript)
+# Original repository: https://github.com/SBNovaScript/asmqdm
+# See LICENSE and NOTICE in the repository root for details.
+# Please retain this header, thank you!
+
+"""
+Shared pytest configuration for the asmqdm test suite.
+
+Makes the in-tree package importable without an install step: the
+src/python directory is inserted on sys.path once per session, so
+individual test modules don't each need a path shim.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_SRC = str(Path(__file__).resolve().parents[1] / "src" / "python")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+from asmqdm import asmqdm  # noqa: E402  (needs the path shim above)
+
+
+@pytest.fixture
+def pbar_factory():
+    """Factory recycling a single asmqdm instance via _reset().
+
+    Tests that only need a bar's Python-side behaviour can request this
+    fixture instead of constructing a fresh instance, skipping repeated
+    FFI initialization.
+    """
+    bar = asmqdm(total=0, disable=True)
+
+    def factory(**kwargs):
+        return bar._reset(**kwargs)
+
+    yield factory
+    bar.close()
@@ -8,44 +8,55 @@
 Tests for asmqdm - Assembly-based progress bar library
 """
 
-import sys
 import time
 
 import pytest
 
-# Add src/python to path for testing
-sys.path.insert(0, str(__file__).rsplit("/", 2)[0] + "/src/python")
+# src/python is put on sys.path once per session by tests/conftest.py
 
 from asmqdm import asmqdm, trange
 
 
+# Expected values hoisted to module scope so they're built once at
+# collection, not per test run; plain asserts let pytest render the
+# diff instead of eagerly formatting a message on the passing path.
+_R10 = list(range(10))
+
+
 class TestBasicIteration:
     """Test basic iteration functionality."""
 
-    def test_iterate_range(self):
-        """Should iterate over range correctly."""
+    @pytest.mark.parametrize("iterable,expected", [
+        (range(10), _R10),
+        (["a", "b", "c"], ["a", "b", "c"]),
+        ([], []),
+        (range(0), []),
+    ])
+    def test_iterate(self, iterable, expected):
+        """Should yield every item of the wrapped iterable in order."""
+        result = list(asmqdm(iterable, disable=True))
+        assert result == expected
+
+    def test_iterate_manual_loop(self):
+        """A plain for-loop over the bar should see the same items."""
         result = []
         for i in asmqdm(range(10), disable=True):
             result.append(i)
-        assert result == list(range(10))
-
-    def test_iterate_list(self):
-        """Should iterate over list correctly."""
-        items = ["a", "b", "c"]
-        result = []
-        for item in asmqdm(items, disable=True):
-            result.append(item)
-        assert result == items
+        assert result == _R10
 
     def test_trange(self):
         """trange should work like asmqdm(range(...))."""
         result = list(trange(5, disable=True))
         assert result == [0, 1, 2, 3, 4]
 
-    def test_empty_iterable(self):
-        """Should handle empty iterables."""
-        result = list(asmqdm([], disable=True))
-        assert result == []
+    def test_partial_iteration_keeps_n_current(self):
+        """Breaking out early should leave n at the consumed count."""
+        pbar = asmqdm(range(100), leave=False)
+        for i in pbar:
+            if i == 24:
+                break
+        assert pbar.n == 25
+        pbar.close()
 
     def test_total_inferred_from_list(self):
         """Total should be inferred from list length."""
@@ -84,6 +95,13 @@ class TestManualUpdate:
             pbar.update()
             assert pbar.n == 3
 
+    def test_update_many(self):
+        """update_many should fold a batch into one update."""
+        with asmqdm(total=100, disable=True) as pbar:
+            pbar.update_many(60)
+            pbar.update_many(40)
+            assert pbar.n == 100
+
 
 class TestDescription:
     """Test description functionality."""
@@ -130,45 +148,70 @@ class TestFlags:
         pbar.close()
 
 
+class TestDrive:
+    """Test the drive() whole-loop fast path."""
+
+    def test_drive_range(self):
+        """drive() should consume the whole range and count it."""
+        pbar = asmqdm(range(50), leave=False)
+        pbar.drive()
+        assert pbar.n == 50
+
+    def test_drive_range_native(self):
+        """drive() should run the loop through progress_bar_run_range."""
+        from asmqdm import _ffi
+
+        pbar = asmqdm(range(40), leave=False)
+        # Empty-range probe: returns a count when the symbol is
+        # exported, None when the loaded library predates it
+        if _ffi.run_range(pbar._state_ptr, 0, 0) is None:
+            pbar.close()
+            pytest.skip("libasmqdm.so lacks progress_bar_run_range")
+        pbar.drive()
+        assert pbar.n == 40
+
+    def test_drive_non_range_falls_back(self):
+        """drive() should fall back to iteration for other iterables."""
+        pbar = asmqdm([1, 2, 3], leave=False)
+        pbar.drive()
+        assert pbar.n == 3
+
+
 class TestOutput:
     """Test progress bar output (visual tests)."""
 
-    def test_renders_without_crash(self, capsys):
-        """Should render without crashing."""
-        for i in asmqdm(range(5)):
-            time.sleep(0.01)
-        # Just checking it doesn't crash
-
-    def test_with_description_renders(self, capsys):
-        """Should render with description."""
-        for i in asmqdm(range(5), desc="Processing"):
-            time.sleep(0.01)
-        # Just checking it doesn't crash
+    def test_render_paths(self, capfd):
+        """Both the no-desc and with-desc render paths should emit output."""
+        for desc in (None, "Processing"):
+            for i in asmqdm(range(5), desc=desc):
+                pass
+        out, _ = capfd.readouterr()
+        assert out  # The renderer writes straight to the stdout fd
 
     def test_trange_renders(self, capsys):
         """trange should render properly."""
         for i in trange(5):
-            time.sleep(0.01)
+            pass
 
 
 class TestFormatDict:
     """Test format_dict property."""
 
-    def test_format_dict_contains_n(self):
+    def test_format_dict_contains_n(self, pbar_factory):
         """format_dict should contain current iteration count."""
-        with asmqdm(total=10, disable=True) as pbar:
-            pbar.update(5)
-            assert pbar.format_dict["n"] == 5
+        pbar = pbar_factory(total=10, disable=True)
+        pbar.update(5)
+        assert pbar.format_dict["n"] == 5
 
-    def test_format_dict_contains_total(self):
+    def test_format_dict_contains_total(self, pbar_factory):
         """format_dict should contain total."""
-        with asmqdm(total=100, disable=True) as pbar:
-            assert pbar.format_dict["total"] == 100
+        pbar = pbar_factory(total=100, disable=True)
+        assert pbar.format_dict["total"] == 100
 
-    def test_format_dict_contains_desc(self):
+    def test_format_dict_contains_desc(self, pbar_factory):
         """format_dict should contain description."""
-        with asmqdm(total=10, desc="Test", disable=True) as pbar:
-            assert pbar.format_dict["desc"] == "Test"
+        pbar = pbar_factory(total=10, desc="Test", disable=True)
+        assert pbar.format_dict["desc"] == "Test"
 
 
 class TestLen:
@@ -192,16 +235,56 @@ class TestFFI:
         assert width > 0
         assert width < 10000  # Sanity check
 
+    def test_terminal_width_cached(self):
+        """Cached width should match the direct read and stay stable."""
+        from asmqdm import _ffi
+
+        width = _ffi.terminal_width_cached()
+        assert width == _ffi.terminal_width()
+        assert _ffi.terminal_width_cached() == width
+
     def test_time_ns(self):
         """Should return monotonic time in nanoseconds."""
         from asmqdm import _ffi
 
         t1 = _ffi.time_ns()
-        time.sleep(0.01)
+        time.sleep(0.0001)
         t2 = _ffi.time_ns()
-        # Should have elapsed at least 10ms = 10,000,000 ns
+        # clock_gettime resolves to ~1ns via the vDSO, so a 100us sleep
+        # is trivially distinguishable
         assert t2 > t1
-        assert t2 - t1 > 1_000_000  # At least 1ms
+        assert t2 - t1 > 50_000  # At least 50us
+
+
+class TestNumba:
+    """Test the optional Numba integration."""
+
+    def test_numba_counter(self):
+        """A compiled kernel should drive the bar through the handle."""
+        numba = pytest.importorskip("numba")
+        pytest.importorskip("numpy")
+        from asmqdm._numba import numba_handle
+
+        @numba.njit(nogil=True)
+        def kernel(counter, n):
+            for _ in range(n):
+                counter[0] += 1
+
+        with numba_handle(total=1000, leave=False) as handle:
+            kernel(handle.counter, 1000)
+        assert handle.n == 1000
+
+    def test_iterate_decorator(self):
+        """@iterate should run the whole loop compiled and report fully."""
+        pytest.importorskip("numba")
+        pytest.importorskip("numpy")
+        from asmqdm import iterate
+
+        @iterate(total=500, leave=False)
+        def step(i):
+            pass
+
+        assert step() == 500
 
 
 if __name__ == "__main__":